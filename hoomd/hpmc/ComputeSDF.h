@@ -185,7 +185,8 @@ template<class Shape> class ComputeSDF : public Compute
                       const quat<Scalar>& orientation_i,
                       const quat<Scalar>& orientation_j,
                       const typename Shape::param_type& params_i,
-                      const typename Shape::param_type& params_j);
+                      const typename Shape::param_type& params_j,
+                      size_t max_bin);
 
     //! Return the sdf
     virtual void computeSDF(uint64_t timestep);
@@ -249,13 +250,18 @@ template<class Shape> void ComputeSDF<Shape>::computeSDF(uint64_t timestep)
 
     countHistogram(timestep);
 
-    std::vector<double> hist_total(m_hist_compression);
-    std::vector<double> hist_total_expansion(m_hist_expansion);
+    // without domain decomposition, the local histograms are the totals
+    const std::vector<double>* hist_compression = &m_hist_compression;
+    const std::vector<double>* hist_expansion = &m_hist_expansion;
 
 // in MPI, total up all of the histogram bins from all nodes to the root node
 #ifdef ENABLE_MPI
+    std::vector<double> hist_total;
+    std::vector<double> hist_total_expansion;
     if (m_sysdef->isDomainDecomposed())
         {
+        hist_total.resize(m_hist_compression.size());
+        hist_total_expansion.resize(m_hist_expansion.size());
         MPI_Reduce(m_hist_compression.data(),
                    hist_total.data(),
                    (unsigned int)m_hist_compression.size(),
@@ -270,23 +276,27 @@ template<class Shape> void ComputeSDF<Shape>::computeSDF(uint64_t timestep)
                    MPI_SUM,
                    0,
                    m_exec_conf->getMPICommunicator());
+        hist_compression = &hist_total;
+        hist_expansion = &hist_total_expansion;
         }
 #endif
 
     // compute the probability density
-    m_sdf_compression.resize(m_hist_compression.size());
-    m_sdf_expansion.resize(m_hist_expansion.size());
-    for (size_t i = 0; i < m_hist_compression.size(); i++)
+    m_sdf_compression.resize(hist_compression->size());
+    m_sdf_expansion.resize(hist_expansion->size());
+    for (size_t i = 0; i < hist_compression->size(); i++)
         {
-        m_sdf_compression[i] = hist_total[i] / (m_pdata->getNGlobal() * m_dx);
+        m_sdf_compression[i] = (*hist_compression)[i] / (m_pdata->getNGlobal() * m_dx);
         }
-    for (size_t i = 0; i < m_hist_expansion.size(); i++)
+    for (size_t i = 0; i < hist_expansion->size(); i++)
         {
-        m_sdf_expansion[i] = hist_total_expansion[i] / (m_pdata->getNGlobal() * m_dx);
+        m_sdf_expansion[i] = (*hist_expansion)[i] / (m_pdata->getNGlobal() * m_dx);
         }
     }
 
-// \return the sdf histogram
+// \return a copy of the sdf histogram
+// The copy is intentional: m_sdf_compression is overwritten (and may be reallocated) by the next
+// compute, while Python loggers may keep references to the arrays from previous timesteps.
 template<class Shape> pybind11::object ComputeSDF<Shape>::getSDFCompression()
     {
 #ifdef ENABLE_MPI
@@ -297,7 +307,7 @@ template<class Shape> pybind11::object ComputeSDF<Shape>::getSDFCompression()
     return pybind11::array_t<double>(m_sdf_compression.size(), m_sdf_compression.data());
     }
 
-// \return the sdf histogram for expansion moves
+// \return a copy of the sdf histogram for expansion moves
 template<class Shape> pybind11::object ComputeSDF<Shape>::getSDFExpansion()
     {
 #ifdef ENABLE_MPI
@@ -429,11 +439,13 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramBinarySearch(uint64_
                             // put particles in coordinate system of particle i
                             vec3<Scalar> r_ij = vec3<Scalar>(postype_j) - pos_i_image;
 
+                            // only search below the first overlap found so far
                             size_t bin = computeBin(r_ij,
                                                     orientation_i,
                                                     orientation_j,
                                                     params[__scalar_as_int(postype_i.w)],
-                                                    params[__scalar_as_int(postype_j.w)]);
+                                                    params[__scalar_as_int(postype_j.w)],
+                                                    min_bin);
 
                             if (bin >= 0)
                                 {
@@ -706,8 +718,9 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_
     \param orientation_j Orientation of particle j
     \param params_i Parameters for particle i
     \param params_j Parameters for particle j
+    \param max_bin Right boundary of the search (at most the number of bins)
 
-    \returns s bin index
+    \returns s bin index, or max_bin when the particles do not overlap at the right boundary
 
     In the first general version, computeBin uses a binary search tree to determine
     the bin. In this way, only a test_overlap method is needed, no extra math. The
@@ -715,16 +728,25 @@ template<class Shape> void ComputeSDF<Shape>::countHistogramLinearSearch(uint64_
     left boundary and does overlap at the right. Then it picks a new point halfway between
     the left and right, ensuring that the same assumption holds. Once right=left+1, the
     correct bin has been found.
+
+    Callers that only need the minimum bin over many pairs pass the smallest bin found so far
+    as max_bin, which narrows the search window and skips pairs that cannot lower the minimum
+    after a single overlap check.
 */
 template<class Shape>
 size_t ComputeSDF<Shape>::computeBin(const vec3<Scalar>& r_ij,
                                      const quat<Scalar>& orientation_i,
                                      const quat<Scalar>& orientation_j,
                                      const typename Shape::param_type& params_i,
-                                     const typename Shape::param_type& params_j)
+                                     const typename Shape::param_type& params_j,
+                                     size_t max_bin)
     {
     size_t L = 0;
-    size_t R = m_hist_compression.size();
+    size_t R = max_bin;
+
+    // no bin can be lower than bin 0
+    if (R == 0)
+        return max_bin;
 
     // if the particles already overlap a the left boundary, return an out of range value
     if (detail::test_scaled_overlap<Shape>(r_ij,
@@ -742,7 +764,7 @@ size_t ComputeSDF<Shape>::computeBin(const vec3<Scalar>& r_ij,
                                             params_i,
                                             params_j,
                                             double(R) * m_dx))
-        return m_hist_compression.size();
+        return max_bin;
 
     // progressively narrow the search window by halves
     do
@@ -20,6 +20,26 @@ from hoomd.data.parameterdicts import ParameterDict
 from hoomd.logging import log
 import hoomd
 import numpy
+import warnings
+from numpy.polynomial import chebyshev
+
+
+def _cpp_classes(prefix):
+    """Map the names of the C++ classes starting with ``prefix`` to classes.
+
+    The keys omit ``prefix``, leaving the integrator name and the optional
+    ``GPU`` suffix.
+    """
+    return {
+        name[len(prefix):]: getattr(_hpmc, name)
+        for name in dir(_hpmc)
+        if name.startswith(prefix)
+    }
+
+
+# Look up the exported classes once instead of on every attach.
+_free_volume_classes = _cpp_classes('ComputeFreeVolume')
+_sdf_classes = _cpp_classes('ComputeSDF')
 
 
 class FreeVolume(Compute):
@@ -100,6 +120,10 @@ class FreeVolume(Compute):
 
     """
 
+    _skip_for_equality = Compute._skip_for_equality | {
+        '_free_volume_step', '_free_volume'
+    }
+
     def __init__(self, test_particle_type, num_samples):
         # store metadata
         param_dict = ParameterDict(test_particle_type=str, num_samples=int)
@@ -108,6 +132,10 @@ class FreeVolume(Compute):
                  num_samples=num_samples))
         self._param_dict.update(param_dict)
 
+        # free volume computed at the timestep _free_volume_step
+        self._free_volume_step = None
+        self._free_volume = None
+
     def _attach_hook(self):
         integrator = self._simulation.operations.integrator
         if not isinstance(integrator, integrate.HPMCIntegrator):
@@ -115,26 +143,33 @@ class FreeVolume(Compute):
 
         # Extract 'Shape' from '<hoomd.hpmc.integrate.Shape object>'
         integrator_name = integrator.__class__.__name__
-        try:
-            if isinstance(self._simulation.device, hoomd.device.CPU):
-                cpp_cls = getattr(_hpmc, 'ComputeFreeVolume' + integrator_name)
-            else:
-                cpp_cls = getattr(_hpmc,
-                                  'ComputeFreeVolume' + integrator_name + 'GPU')
-        except AttributeError:
+        on_cpu = isinstance(self._simulation.device, hoomd.device.CPU)
+        cpp_cls = _free_volume_classes.get(integrator_name
+                                           + ('' if on_cpu else 'GPU'))
+        if cpp_cls is None:
             raise RuntimeError("Unsupported integrator.")
 
-        cl = _hoomd.CellList(self._simulation.state._cpp_sys_def)
+        if on_cpu:
+            cl = _hoomd.CellList(self._simulation.state._cpp_sys_def)
+        else:
+            cl = _hoomd.CellListGPU(self._simulation.state._cpp_sys_def)
+
         self._cpp_obj = cpp_cls(self._simulation.state._cpp_sys_def,
                                 integrator._cpp_obj, cl)
+        self._free_volume_step = None
 
     @log(requires_run=True)
     def free_volume(self):
         """Free volume available to the test particle \
         :math:`[\\mathrm{length}^{2}]` in 2D and \
         :math:`[\\mathrm{length}^{3}]` in 3D."""
-        self._cpp_obj.compute(self._simulation.timestep)
-        return self._cpp_obj.free_volume
+        # Multiple loggers may request the free volume on the same step.
+        timestep = self._simulation.timestep
+        if timestep != self._free_volume_step:
+            self._cpp_obj.compute(timestep)
+            self._free_volume = self._cpp_obj.free_volume
+            self._free_volume_step = timestep
+        return self._free_volume
 
 
 class SDF(Compute):
@@ -322,6 +357,11 @@ class SDF(Compute):
         dx (float): Bin width :math:`[\mathrm{length}]`.
     """
 
+    _skip_for_equality = Compute._skip_for_equality | {
+        '_fit_num_bins', '_fit_weights', '_x_key', '_x', '_sdf_step', '_sdf',
+        '_betaP_step', '_betaP'
+    }
+
     def __init__(self, xmax, dx):
         # store metadata
         param_dict = ParameterDict(
@@ -330,6 +370,20 @@ class SDF(Compute):
         )
         self._param_dict.update(param_dict)
 
+        # bin centers and weights of the extrapolating fits, valid for the
+        # bins in _x_key and _fit_num_bins respectively
+        self._x_key = None
+        self._x = None
+        self._fit_num_bins = None
+        self._fit_weights = None
+
+        # sdf arrays and betaP computed at the timesteps _sdf_step and
+        # _betaP_step respectively
+        self._sdf_step = None
+        self._sdf = None
+        self._betaP_step = None
+        self._betaP = None
+
     def _attach_hook(self):
         integrator = self._simulation.operations.integrator
         if not isinstance(integrator, integrate.HPMCIntegrator):
@@ -338,7 +392,9 @@ class SDF(Compute):
         # Extract 'Shape' from '<hoomd.hpmc.integrate.Shape object>'
         integrator_name = integrator.__class__.__name__
 
-        cpp_cls = getattr(_hpmc, 'ComputeSDF' + integrator_name)
+        cpp_cls = _sdf_classes.get(integrator_name)
+        if cpp_cls is None:
+            raise RuntimeError("Unsupported integrator.")
 
         self._cpp_obj = cpp_cls(
             self._simulation.state._cpp_sys_def,
@@ -346,6 +402,8 @@ class SDF(Compute):
             self.xmax,
             self.dx,
         )
+        self._sdf_step = None
+        self._betaP_step = None
 
     @log(category='sequence', requires_run=True)
     def sdf_compression(self):
@@ -360,8 +418,12 @@ class SDF(Compute):
             In MPI parallel execution, the array is available on rank 0 only.
             `sdf_compression` is `None` on ranks >= 1.
         """
-        self._cpp_obj.compute(self._simulation.timestep)
-        return self._cpp_obj.sdf_compression
+        sdf_compression = self._get_sdf()[0]
+
+        if sdf_compression is not None:
+            return sdf_compression.copy()
+        else:
+            return None
 
     @log(category='sequence', requires_run=True)
     def sdf_expansion(self):
@@ -376,11 +438,10 @@ class SDF(Compute):
             In MPI parallel execution, the array is available on rank 0 only.
             `sdf_expansion` is `None` on ranks >= 1.
         """
-        self._cpp_obj.compute(self._simulation.timestep)
-        cpp_expansion = self._cpp_obj.sdf_expansion
+        sdf_expansion = self._get_sdf()[1]
 
-        if cpp_expansion is not None:
-            return numpy.array(cpp_expansion[::-1])
+        if sdf_expansion is not None:
+            return sdf_expansion.copy()
         else:
             return None
 
@@ -391,10 +452,8 @@ class SDF(Compute):
         distribution function for the compressive perturbations \
         :math:`[\\mathrm{length}]`."""
         # Ensure that num_bins is up to date.
-        self._cpp_obj.compute(self._simulation.timestep)
-
-        x = numpy.arange(0, self._cpp_obj.num_bins, 1) * self.dx + self.dx / 2
-        return x
+        self._get_sdf()
+        return self._bin_centers()[0].copy()
 
     @log(category='sequence', requires_run=True)
     def x_expansion(self):
@@ -403,10 +462,8 @@ class SDF(Compute):
         distribution function for the expansion moves \
         :math:`[\\mathrm{length}]`."""
         # Ensure that num_bins is up to date.
-        self._cpp_obj.compute(self._simulation.timestep)
-
-        x = numpy.arange(-self._cpp_obj.num_bins, 0, 1) * self.dx + self.dx / 2
-        return x
+        self._get_sdf()
+        return self._bin_centers()[1].copy()
 
     @log(requires_run=True)
     def betaP(self):  # noqa: N802 - allow function name
@@ -429,13 +486,25 @@ class SDF(Compute):
             In MPI parallel execution, `betaP` is available on rank 0 only.
             `betaP` is `None` on ranks >= 1.
         """
-        sdf_fit_compression = self.sdf_compression
-        x_fit_compression = self.x_compression
+        timestep = self._simulation.timestep
+        if timestep != self._betaP_step:
+            self._betaP = self._compute_betaP()
+            self._betaP_step = timestep
+        return self._betaP
+
+    def _compute_betaP(self):  # noqa: N802 - allow function name
+        """Fit and extrapolate the sdf histograms to compute betaP."""
+        sdf_fit_compression, sdf_fit_expansion = self._get_sdf()
+
+        if sdf_fit_compression is not None and sdf_fit_expansion is not None:
+            # The fit depends only on the number of bins, so precompute the
+            # linear map from the sdf values to the extrapolated value at 0.
+            num_bins = self._cpp_obj.num_bins
+            if num_bins != self._fit_num_bins:
+                weights = self._extrapolation_weights(num_bins)
+                self._fit_weights = (weights, weights[::-1])
+                self._fit_num_bins = num_bins
 
-        sdf_fit_expansion = self.sdf_expansion
-        x_fit_expansion = self.x_expansion
-
-        if self.sdf_compression is not None and self.sdf_expansion is not None:
             compression_contribution = 0
             expansion_contribution = 0
             box = self._simulation.state.box
@@ -444,17 +513,86 @@ class SDF(Compute):
 
             # compressive contribution
             # perform the fit and extrapolation
-            p = numpy.polyfit(x_fit_compression, sdf_fit_compression, 5)
-            p0_compression = numpy.polyval(p, 0.0)
+            p0_compression = self._fit_weights[0] @ sdf_fit_compression
             compression_contribution = rho * p0_compression / (2
                                                                * box.dimensions)
 
             # expansive contribution
             # perform the fit and extrapolation
-            p = numpy.polyfit(x_fit_expansion, sdf_fit_expansion, 5)
-            p0_expansion = numpy.polyval(p, 0.0)
+            p0_expansion = self._fit_weights[1] @ sdf_fit_expansion
             expansion_contribution = -rho * p0_expansion / (2 * box.dimensions)
 
             return rho + compression_contribution + expansion_contribution
         else:
             return None
+
+    def _get_sdf(self):
+        """Get the compression and expansion sdf arrays.
+
+        The sdf is computed and copied from C++ at most once per timestep.
+        The cached arrays are read only: `sdf_compression` and
+        `sdf_expansion` return copies of them. Both are `None` on ranks >= 1.
+        """
+        timestep = self._simulation.timestep
+        if timestep != self._sdf_step:
+            self._cpp_obj.compute(timestep)
+            sdf_compression = self._cpp_obj.sdf_compression
+            sdf_expansion = self._cpp_obj.sdf_expansion
+
+            if sdf_compression is not None and sdf_expansion is not None:
+                sdf_expansion = sdf_expansion[::-1]
+                sdf_compression.flags.writeable = False
+                sdf_expansion.flags.writeable = False
+
+            self._sdf = (sdf_compression, sdf_expansion)
+            self._sdf_step = timestep
+        return self._sdf
+
+    def _bin_centers(self):
+        """Get the compression and expansion bin centers.
+
+        The arrays are only rebuilt when the number of bins or the bin width
+        changes. They are read only: `x_compression` and `x_expansion` return
+        copies of them.
+        """
+        x_key = (self._cpp_obj.num_bins, self.dx)
+        if x_key != self._x_key:
+            num_bins, dx = x_key
+            x_compression = numpy.arange(0, num_bins, 1) * dx + dx / 2
+            x_expansion = numpy.arange(-num_bins, 0, 1) * dx + dx / 2
+            x_compression.flags.writeable = False
+            x_expansion.flags.writeable = False
+            self._x = (x_compression, x_expansion)
+            self._x_key = x_key
+        return self._x
+
+    @staticmethod
+    def _extrapolation_weights(num_bins, degree=5):
+        """Compute weights that extrapolate a polynomial fit to x = 0.
+
+        The fit is a function of the bin index k. The bin centers are at
+        x = (k + 1/2) dx, so x = 0 is at k = -1/2 for any bin width.
+        ``weights @ y`` is the value at x = 0 of the least squares polynomial
+        fit of the compression histogram ``y``. The reversed weights do the
+        same for the expansion histogram.
+        """
+        if num_bins <= degree:
+            # The fit is underdetermined. Match the minimum norm solution of
+            # numpy.polyfit, which fits monomials with scaled columns. Column
+            # scaling makes the result independent of dx, so fit in k + 1/2.
+            warnings.warn("Polyfit may be poorly conditioned",
+                          numpy.exceptions.RankWarning,
+                          stacklevel=4)
+            vander = numpy.vander(numpy.arange(num_bins) + 0.5, degree + 1)
+            scale = numpy.sqrt((vander * vander).sum(axis=0))
+            pinv = numpy.linalg.pinv(vander / scale,
+                                     rcond=num_bins * numpy.finfo(float).eps)
+            return pinv[-1] / scale[-1]
+
+        # Fit in the Chebyshev basis with k mapped onto [-1, 1], which is well
+        # conditioned for any number of bins.
+        center = (num_bins - 1) / 2
+        k = numpy.arange(num_bins)
+        vander = chebyshev.chebvander((k - center) / center, degree)
+        at_zero = chebyshev.chebvander((-0.5 - center) / center, degree)[0]
+        return at_zero @ numpy.linalg.pinv(vander)
@@ -42,6 +42,40 @@ def test_after_attaching(simulation_factory, lattice_snapshot_factory):
     assert isinstance(free_volume.free_volume, float)
 
 
+def test_cache(simulation_factory, lattice_snapshot_factory):
+    """Test that free_volume is computed once per timestep and attachment."""
+    sim = simulation_factory(
+        lattice_snapshot_factory(particle_types=['A', 'B']))
+    mc = hoomd.hpmc.integrate.Sphere()
+    mc.shape["A"] = {'diameter': 0.5}
+    mc.shape["B"] = {'diameter': 0.2}
+    sim.operations.integrator = mc
+
+    free_volume = hoomd.hpmc.compute.FreeVolume(test_particle_type='B',
+                                                num_samples=10000)
+    sim.operations.computes.append(free_volume)
+    sim.run(0)
+
+    # repeated reads in one timestep return the cached value, even when the
+    # system changes
+    large_free_volume = free_volume.free_volume
+    assert free_volume.free_volume is large_free_volume
+    mc.shape["B"] = {'diameter': 1.0}
+    assert free_volume.free_volume is large_free_volume
+
+    # the value updates when the timestep advances
+    sim.run(1)
+    small_free_volume = free_volume.free_volume
+    assert small_free_volume < large_free_volume
+
+    # a new attachment does not return the value cached before it
+    sim.operations.computes.remove(free_volume)
+    mc.shape["B"] = {'diameter': 0.2}
+    sim.operations.computes.append(free_volume)
+    sim.run(0)
+    assert free_volume.free_volume > small_free_volume
+
+
 _radii = [
     (0.25, 0.05),
     (0.4, 0.05),
@@ -3,6 +3,7 @@
 
 from __future__ import print_function
 from __future__ import division
+import contextlib
 import hoomd
 import pytest
 import numpy
@@ -121,6 +122,124 @@ def test_after_attaching(valid_args, simulation_factory,
         assert betaP is None
 
 
+@pytest.mark.cpu  # SDF runs on the CPU only, no need to test on the GPU
+def test_cache(simulation_factory, lattice_snapshot_factory):
+    """Test that betaP is computed once per timestep and attachment."""
+    # With a = 1.1 and d = 1, no compression up to xmax causes an overlap.
+    # With d = 1.09, all particles overlap at x = 1/110.
+    sim = simulation_factory(lattice_snapshot_factory(a=1.1, n=5))
+    mc = hoomd.hpmc.integrate.Sphere(default_d=0)
+    mc.shape["A"] = {'diameter': 1.0}
+    sim.operations.integrator = mc
+
+    sdf = hoomd.hpmc.compute.SDF(xmax=0.02, dx=1e-3)
+    sim.operations.computes.append(sdf)
+    sim.run(0)
+
+    # repeated reads in one timestep return the cached value, even when the
+    # system changes
+    betaP = sdf.betaP
+    assert sdf.betaP is betaP
+    mc.shape["A"] = {'diameter': 1.09}
+    assert sdf.betaP is betaP
+
+    # the value updates when the timestep advances
+    sim.run(1)
+    overlapping_betaP = sdf.betaP
+    if sim.device.communicator.rank == 0:
+        rho = sim.state.N_particles / sim.state.box.volume
+        assert betaP == pytest.approx(rho)
+        assert overlapping_betaP != pytest.approx(rho)
+
+    # a new attachment does not return the value cached before it
+    sim.operations.computes.remove(sdf)
+    mc.shape["A"] = {'diameter': 1.0}
+    sim.operations.computes.append(sdf)
+    sim.run(0)
+    if sim.device.communicator.rank == 0:
+        assert sdf.betaP == pytest.approx(betaP)
+
+
+@pytest.mark.cpu  # SDF runs on the CPU only, no need to test on the GPU
+def test_sdf_arrays(simulation_factory, lattice_snapshot_factory):
+    """Test that the sdf arrays are independent copies of the current sdf."""
+    sim = simulation_factory(lattice_snapshot_factory(a=1.1, n=5))
+    mc = hoomd.hpmc.integrate.Sphere(default_d=0)
+    mc.shape["A"] = {'diameter': 1.0}
+    sim.operations.integrator = mc
+
+    sdf = hoomd.hpmc.compute.SDF(xmax=0.02, dx=1e-3)
+    sim.operations.computes.append(sdf)
+    sim.run(0)
+
+    if sim.device.communicator.rank > 0:
+        assert sdf.sdf_compression is None
+        assert sdf.sdf_expansion is None
+        return
+
+    for name in ('sdf_compression', 'sdf_expansion'):
+        first = getattr(sdf, name)
+        second = getattr(sdf, name)
+        assert first is not second
+        numpy.testing.assert_array_equal(first, second)
+
+        # modifying a returned array does not change later reads
+        first += 1
+        numpy.testing.assert_array_equal(getattr(sdf, name), second)
+
+    # the arrays refresh when the timestep advances
+    assert numpy.count_nonzero(sdf.sdf_compression) == 0
+    mc.shape["A"] = {'diameter': 1.09}
+    sim.run(1)
+    assert numpy.count_nonzero(sdf.sdf_compression) == 1
+
+
+def test_unsupported_integrator(simulation_factory,
+                                two_particle_snapshot_factory, monkeypatch):
+    """Test that SDF raises RuntimeError when there is no C++ class."""
+    monkeypatch.setattr(hoomd.hpmc.compute, '_sdf_classes', {})
+
+    sim = simulation_factory(two_particle_snapshot_factory())
+    mc = hoomd.hpmc.integrate.Sphere()
+    mc.shape['A'] = {'diameter': 1.0}
+    sim.operations.integrator = mc
+
+    sdf = hoomd.hpmc.compute.SDF(xmax=0.02, dx=1e-4)
+    sim.operations.computes.append(sdf)
+    with pytest.raises(RuntimeError, match="Unsupported integrator"):
+        sim.run(0)
+
+
+@pytest.mark.parametrize("num_bins, dx", [(1, 1e-4), (2, 1e-4), (3, 1e-4),
+                                          (4, 1e-4), (5, 1e-4), (6, 1e-4),
+                                          (7, 1e-4), (200, 1e-4), (2000, 1e-5)])
+def test_extrapolation_weights(num_bins, dx):
+    """Test the SDF fit against numpy.polyfit on the x_* bin centers."""
+    rng = numpy.random.default_rng(num_bins)
+    x_compression = numpy.arange(0, num_bins) * dx + dx / 2
+    x_expansion = numpy.arange(-num_bins, 0) * dx + dx / 2
+    y_compression = rng.uniform(0, 100, num_bins)
+    y_expansion = rng.uniform(0, 100, num_bins)
+
+    if num_bins < 6:
+        # numpy.polyfit and SDF both warn when the fit is underdetermined.
+        context = pytest.warns(numpy.exceptions.RankWarning)
+    else:
+        context = contextlib.nullcontext()
+
+    with context:
+        weights = hoomd.hpmc.compute.SDF._extrapolation_weights(num_bins)
+        fit_compression = numpy.polyfit(x_compression, y_compression, 5)
+        fit_expansion = numpy.polyfit(x_expansion, y_expansion, 5)
+
+    numpy.testing.assert_allclose(weights @ y_compression,
+                                  numpy.polyval(fit_compression, 0),
+                                  rtol=1e-8)
+    numpy.testing.assert_allclose(weights[::-1] @ y_expansion,
+                                  numpy.polyval(fit_expansion, 0),
+                                  rtol=1e-8)
+
+
 _avg = numpy.array([
     55.20126953, 54.89853516, 54.77910156, 54.56660156, 54.22255859,
     53.83935547, 53.77617188, 53.42109375, 53.05546875, 52.86376953,
@@ -29,20 +29,21 @@ shape_move_constructor_args = [
           normal_shear_ratio=0.5)),
 ]
 
+# shape moves are constructed in the tests from (class, constructor args) so
+# that each test gets a fresh instance
+elastic_args = dict(stiffness=1, mc=hpmc.integrate.ConvexPolyhedron)
+
 shape_move_valid_attrs = [
-    (Vertex(), "vertex_move_probability", 0.1),
-    (ShapeSpace(callback=_test_callback), "param_move_probability", 0.1),
-    (ShapeSpace(callback=_test_callback), "callback",
+    (Vertex, dict(), "vertex_move_probability", 0.1),
+    (ShapeSpace, dict(callback=_test_callback), "param_move_probability", 0.1),
+    (ShapeSpace, dict(callback=_test_callback), "callback",
      lambda type, param_list: {}),
-    (Elastic(1, hpmc.integrate.ConvexPolyhedron), "normal_shear_ratio", 0.5),
-    (Elastic(1, hpmc.integrate.ConvexPolyhedron), "stiffness",
-     hoomd.variant.Constant(10)),
-    (Elastic(1, hpmc.integrate.ConvexPolyhedron), "stiffness",
-     hoomd.variant.Ramp(1, 5, 0, 100)),
-    (Elastic(1, hpmc.integrate.ConvexPolyhedron), "stiffness",
+    (Elastic, elastic_args, "normal_shear_ratio", 0.5),
+    (Elastic, elastic_args, "stiffness", hoomd.variant.Constant(10)),
+    (Elastic, elastic_args, "stiffness", hoomd.variant.Ramp(1, 5, 0, 100)),
+    (Elastic, elastic_args, "stiffness",
      hoomd.variant.Cycle(1, 5, 0, 10, 20, 10, 15)),
-    (Elastic(1, hpmc.integrate.ConvexPolyhedron), "stiffness",
-     hoomd.variant.Power(1, 5, 3, 0, 100))
+    (Elastic, elastic_args, "stiffness", hoomd.variant.Power(1, 5, 3, 0, 100))
 ]
 
 shape_updater_valid_attrs = [("trigger", hoomd.trigger.Periodic(10)),
@@ -75,15 +76,16 @@ updater_constructor_args = [
 ]
 
 type_parameters = [
-    (ShapeSpace(callback=_test_callback), "params", [0.1, 0.3, 0.4]),
-    (ShapeSpace(callback=_test_callback), "step_size", 0.4),
-    (Vertex(), "volume", 1.2), (Vertex(), "step_size", 0.1),
-    (Elastic(stiffness=10.0,
-             mc=hpmc.integrate.ConvexPolyhedron), "reference_shape", {
-                 "vertices": verts
-             }),
-    (Elastic(stiffness=10.0,
-             mc=hpmc.integrate.ConvexPolyhedron), "step_size", 0.2)
+    (ShapeSpace, dict(callback=_test_callback), "params", [0.1, 0.3, 0.4]),
+    (ShapeSpace, dict(callback=_test_callback), "step_size", 0.4),
+    (Vertex, dict(), "volume", 1.2),
+    (Vertex, dict(), "step_size", 0.1),
+    (Elastic, dict(stiffness=10.0,
+                   mc=hpmc.integrate.ConvexPolyhedron), "reference_shape", {
+                       "vertices": verts
+                   }),
+    (Elastic, dict(stiffness=10.0,
+                   mc=hpmc.integrate.ConvexPolyhedron), "step_size", 0.2),
 ]
 
 
@@ -108,9 +110,11 @@ def test_valid_construction_shape_updater(updater_constructor_args):
         assert getattr(updater, attr) == value
 
 
-@pytest.mark.parametrize("shape_move_obj,attr,value", shape_move_valid_attrs)
-def test_valid_setattr_shape_move(shape_move_obj, attr, value):
+@pytest.mark.parametrize("shape_move_class,params,attr,value",
+                         shape_move_valid_attrs)
+def test_valid_setattr_shape_move(shape_move_class, params, attr, value):
     """Test that the shape move classes can get and set attributes."""
+    shape_move_obj = shape_move_class(**params)
     setattr(shape_move_obj, attr, value)
     assert getattr(shape_move_obj, attr) == value
 
@@ -124,8 +128,9 @@ def test_valid_setattr_shape_updater(attr, value):
     assert getattr(updater, attr) == value
 
 
-@pytest.mark.parametrize("obj,attr,value", type_parameters)
-def test_type_parameters(obj, attr, value):
+@pytest.mark.parametrize("shape_move_class,params,attr,value", type_parameters)
+def test_type_parameters(shape_move_class, params, attr, value):
+    obj = shape_move_class(**params)
     getattr(obj, attr)["A"] = value
     hoomd.conftest.equality_check(getattr(obj, attr)["A"], value)
 
@@ -181,15 +186,13 @@ def test_python_callback_shape_move_ellipsoid(simulation_factory,
     class ScaleEllipsoid:
 
         def __init__(self, a, b, c):
-            self.vol_factor = 4 * np.pi / 3
-            self.volume = self.vol_factor * a * b * c
-            self.default_dict = dict(ignore_statistics=True)
+            # volume / (4 pi / 3): the only constant needed per call
+            self.abc = a * b * c
 
         def __call__(self, type_id, param_list):
             x = param_list[0]
-            b = (self.volume / x / (self.vol_factor))**(1 / 3)
-            ret = dict(a=x * b, b=b, c=b, **self.default_dict)
-            return ret
+            b = (self.abc / x)**(1 / 3)
+            return dict(a=x * b, b=b, c=b, ignore_statistics=True)
 
     ellipsoid = dict(a=1, b=1, c=1)
 
@@ -382,3 +385,39 @@ def test_elastic_shape_move(simulation_factory, two_particle_snapshot_factory):
     # mean vertex displacement should be smaller for stiffer particles
     dr_k100 = np.linalg.norm(mc.shape["A"]["vertices"] - verts, axis=1).mean()
     assert dr_k100 < dr_k1
+
+
+@pytest.mark.parametrize("b_B,valid", [(0.5, True), (0.7, False)])
+def test_elastic_shape_move_ellipsoid(simulation_factory,
+                                      lattice_snapshot_factory, monkeypatch,
+                                      b_B, valid):
+    """Test that Elastic requires Ellipsoid shapes to be spheres."""
+    # Elastic validates Ellipsoid integrators on attach, but the constructor
+    # only accepts ConvexPolyhedron, so this branch is not reachable through
+    # the public API. Patch the supported shapes to exercise it.
+    monkeypatch.setattr(Elastic, "_suported_shapes",
+                        {"ConvexPolyhedron", "Ellipsoid"})
+
+    sphere = dict(a=0.5, b=0.5, c=0.5)
+    mc = hoomd.hpmc.integrate.Ellipsoid()
+    mc.shape["A"] = sphere
+    mc.shape["B"] = dict(a=0.5, b=b_B, c=0.5)
+
+    move = Elastic(stiffness=1, mc=mc, default_step_size=0.1)
+    move.reference_shape["A"] = sphere
+    move.reference_shape["B"] = sphere
+
+    updater = hpmc.update.Shape(trigger=1, shape_move=move)
+
+    sim = simulation_factory(
+        lattice_snapshot_factory(particle_types=["A", "B"], a=2, n=3))
+    sim.operations.integrator = mc
+    sim.operations += updater
+
+    if valid:
+        sim.run(0)
+        assert move._attached
+        assert updater._attached
+    else:
+        with pytest.raises(ValueError, match="only works when a=b=c"):
+            sim.run(0)